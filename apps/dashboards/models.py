@@ -3,6 +3,7 @@ import logging
 from urllib2 import HTTPBasicAuthHandler, build_opener
 
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models
 
 from tower import ugettext_lazy as _lazy
@@ -19,6 +20,12 @@ ALL_TIME = 1
 PERIODS = [(THIS_WEEK, _lazy(u'This Week')),
            (ALL_TIME, _lazy(u'All Time'))]
 
+# Cached document counts for the L10n dashboard's Overview table. The total is
+# shared by every locale, so it gets its own key:
+OVERVIEW_TOTAL_CACHE_KEY = u'kuma:dashboards-overview-total'
+OVERVIEW_TRANSLATED_CACHE_KEY_TMPL = u'kuma:dashboards-overview-translated:%s'
+OVERVIEW_CACHE_TIMEOUT = getattr(settings, 'OVERVIEW_CACHE_TIMEOUT', 300)
+
 
 class StatsException(Exception):
     """An error in the stats returned by the third-party analytics package"""
@@ -100,3 +107,13 @@ class WikiDocumentVisits(ModelBase):
                          'document: %s' % url)
             counts[doc.pk] = visits
         return counts
+
+
+def invalidate_overview_counts(sender, instance, **kwargs):
+    """Drop the cached Overview counts affected by a document change."""
+    cache.delete(OVERVIEW_TRANSLATED_CACHE_KEY_TMPL % instance.locale)
+    if instance.locale == settings.WIKI_DEFAULT_LANGUAGE:
+        cache.delete(OVERVIEW_TOTAL_CACHE_KEY)
+
+models.signals.post_save.connect(invalidate_overview_counts, sender=Document)
+models.signals.post_delete.connect(invalidate_overview_counts, sender=Document)
@@ -1,13 +1,24 @@
 """Data aggregators for dashboards"""
 
+try:
+    from collections import OrderedDict
+except ImportError:
+    # Python 2.6
+    from django.utils.datastructures import SortedDict as OrderedDict
+
 from django.conf import settings
+from django.core.cache import cache
 from django.db import connections, router
-from django.utils.datastructures import SortedDict
+from django.utils.encoding import iri_to_uri
+from django.utils.translation import get_language
 
 import jingo
 from tower import ugettext as _, ugettext_lazy as _lazy
 
-from dashboards.models import THIS_WEEK, ALL_TIME, PERIODS
+from dashboards.models import (THIS_WEEK, ALL_TIME, PERIODS,
+                               OVERVIEW_TOTAL_CACHE_KEY,
+                               OVERVIEW_TRANSLATED_CACHE_KEY_TMPL,
+                               OVERVIEW_CACHE_TIMEOUT)
 from sumo.urlresolvers import reverse
 from wiki.models import Document, MEDIUM_SIGNIFICANCE, MAJOR_SIGNIFICANCE
 
@@ -15,33 +26,72 @@ from wiki.models import Document, MEDIUM_SIGNIFICANCE, MAJOR_SIGNIFICANCE
 MOST_VIEWED = 1
 MOST_RECENT = 2
 
+# How many rows of a result to format at a time. This bounds per-chunk work
+# like the IN list of UnreviewedReadout's users query:
+FORMAT_CHUNK_SIZE = 1000
+
+# Stand-in slug for building per-row URLs without a URL resolver walk per row:
+_SLUG_PLACEHOLDER = '__slug__'
+
+# Translated readout labels, keyed by (readout class, attribute, language):
+_labels = {}
 
-def _cursor():
+
+# The readouts query through raw cursors rather than the ORM on purpose: they
+# left-join the visits table on a period condition, which the ORM can't
+# express, and their rows are shaped for prefetch_rows()'s UNION ALL. The
+# MySQLdb backend interpolates parameters client-side either way, so the ORM
+# wouldn't get MySQL to reuse prepared statements or plans.
+def db_cursor():
     """Return a DB cursor for reading."""
     return connections[router.db_for_read(Document)].cursor()
 
 
+def _positional_order(columns, offset=0):
+    """Return an ORDER BY list for (select-list position, direction) pairs,
+    shifting each position by `offset`."""
+    return ', '.join(['%d %s' % (position + offset, direction)
+                      for position, direction in columns])
+
+
 def overview_rows(locale):
     """Return the iterable of dicts needed to draw the Overview table."""
     def percent_or_100(num, denom):
-        return int(round(num / float(denom) * 100)) if denom else 100
+        # Integer math rounds half up without going through floats:
+        return (num * 100 + denom // 2) // denom if denom else 100
 
     # The Overview table is a special case: it has only a static number of
     # rows, so it has no expanded, all-rows view, and thus needs no slug, no
     # "max" kwarg on rows(), etc. It doesn't fit the Readout signature, so we
     # don't shoehorn it in.
-    total = Document.uncached.exclude(current_revision=None).filter(
-                locale=settings.WIKI_DEFAULT_LANGUAGE,
-                is_localizable=True).count()
-
-    # How many approved documents are there in German that have parents?
-    translated = Document.uncached.filter(locale=locale).exclude(
-        current_revision=None).exclude(parent=None).count()
+    cursor = db_cursor()
+
+    # How many approved, localizable English documents are there, and how many
+    # approved documents are there in German that have parents? These change
+    # only when documents are saved or deleted, so they're cached (and
+    # invalidated by signal handlers in dashboards.models). On a miss, both
+    # counts come back from a single query to save a round-trip.
+    translated_key = OVERVIEW_TRANSLATED_CACHE_KEY_TMPL % locale
+    total = cache.get(OVERVIEW_TOTAL_CACHE_KEY)
+    translated = cache.get(translated_key)
+    if total is None or translated is None:
+        cursor.execute(
+            'SELECT '
+                'SUM(locale=%s AND is_localizable), '
+                'SUM(locale=%s AND parent_id IS NOT NULL) '
+            'FROM wiki_document '
+            'WHERE current_revision_id IS NOT NULL AND locale IN (%s, %s)',
+            (settings.WIKI_DEFAULT_LANGUAGE, locale,
+             settings.WIKI_DEFAULT_LANGUAGE, locale))
+        # SUM() yields NULL over no rows and a Decimal otherwise:
+        total, translated = [int(n or 0) for n in cursor.fetchone()]
+        cache.set_many({OVERVIEW_TOTAL_CACHE_KEY: total,
+                        translated_key: translated},
+                       OVERVIEW_CACHE_TIMEOUT)
 
     # Of the top 20 most visited English articles, how many are not translated
     # into German?
     TOP_N = 20
-    cursor = _cursor()
     cursor.execute(
         'SELECT count(*) FROM '
             '(SELECT trans.id FROM dashboards_wikidocumentvisits '
@@ -85,31 +135,53 @@ class Readout(object):
     modes = [(MOST_VIEWED, _lazy('Most Viewed')),
              (MOST_RECENT, _lazy('Most Recent'))]
 
-    def __init__(self, request, locale=None, mode=None):
+    def __init__(self, request, locale=None, mode=None, cursor=None):
         """Take request so the template can use contextual macros that need it.
 
         Renders the data for the locale specified by the request, but you can
         override it by passing another in `locale`.
 
+        Pass a `cursor` to run the readout's query on it rather than opening a
+        new one, so several readouts drawn on one page can share a cursor. The
+        readout leaves closing it to the caller.
+
         """
         self.request = request
+        self._shared_cursor = cursor
+        self._prefetched = None  # (max, rows), set by prefetch_rows()
         self.locale = locale or request.locale
         self.mode = mode or self.modes[0][1]
         # self.mode is allowed to be invalid.
+        self._url_templates = {}
 
     def rows(self, max=None):
-        """Return an iterable of dicts containing the data for the table.
+        """Return a list of dicts containing the data for the table.
 
-        This default implementation calls _query_and_params and _format_row.
+        This default implementation calls _query_and_params and _format_rows.
         You can either implement those or, if you need more flexibility,
         override this.
 
-        Limit to `max` rows.
+        Limit to `max` rows. Rows are handed to _format_rows()
+        FORMAT_CHUNK_SIZE at a time.
 
         """
-        cursor = _cursor()
-        cursor.execute(*self._query_and_params(max))
-        return [self._format_row(r) for r in cursor.fetchall()]
+        if max and self._prefetched:
+            prefetched_max, prefetched_rows = self._prefetched
+            if max <= prefetched_max:
+                return prefetched_rows[:max]
+
+        cursor = self._shared_cursor or db_cursor()
+        try:
+            cursor.execute(*self._limited_query_and_params(max))
+            db_rows = cursor.fetchall()
+        finally:
+            if cursor is not self._shared_cursor:
+                cursor.close()
+
+        rows = []
+        for i in xrange(0, len(db_rows), FORMAT_CHUNK_SIZE):
+            rows.extend(self._format_rows(db_rows[i:i + FORMAT_CHUNK_SIZE]))
+        return rows
 
     def render(self, max_rows=None):
         """Return HTML table rows, optionally limiting to a number of rows."""
@@ -125,29 +197,81 @@ class Readout(object):
         return jingo.render_to_string(
             self.request,
             'dashboards/includes/kb_readout.html',
-            {'rows': rows, 'column3_label': self.column3_label,
-             'column4_label': self.column4_label})
+            {'rows': rows, 'column3_label': self._label('column3_label'),
+             'column4_label': self._label('column4_label')})
 
     # To override:
 
-    def _query_and_params(self, max):
-        """Return a tuple: (query, params to bind it to)."""
+    def _query_and_params(self):
+        """Return a tuple: (query, params to bind it to).
+
+        Leave off any LIMIT clause; rows() adds one as needed.
+
+        """
         raise NotImplementedError
 
     def _format_row(self, row):
         """Turn a DB row tuple into a dict for the template."""
         raise NotImplementedError
 
+    def _format_rows(self, rows):
+        """Turn a chunk of DB row tuples into dicts for the template.
+
+        Override this if formatting needs data fetched for many rows at once.
+
+        """
+        return [self._format_row(r) for r in rows]
+
+    def _order_columns(self):
+        """Return the sort order as (select-list position, 'ASC' or 'DESC')
+        pairs, most significant first.
+
+        Only readouts passed to prefetch_rows() need this. They should build
+        their ORDER BY from it so the combined query sorts the same way.
+
+        """
+        raise NotImplementedError
+
     # Convenience methods:
 
-    @staticmethod
-    def _limit_clause(max):
-        """Return a SQL LIMIT clause limiting returned rows to `max`.
+    def _label(self, attr):
+        """Return lazy attribute `attr` translated into the active language.
 
-        Return '' if max is None.
+        Each label is translated once per language for the life of the
+        process rather than on every render.
 
         """
-        return ' LIMIT %i' % max if max else ''
+        key = (type(self), attr, get_language())
+        if key not in _labels:
+            _labels[key] = unicode(getattr(self, attr))
+        return _labels[key]
+
+    def _slug_url(self, view_name, slug, locale=None):
+        """Return reverse(view_name, args=[slug], locale=locale).
+
+        The URL is reversed only once per view and locale for the life of the
+        readout and the slug substituted into it for each row after that.
+
+        """
+        key = (view_name, locale)
+        template = self._url_templates.get(key)
+        if template is None:
+            template = self._url_templates[key] = reverse(
+                view_name, args=[_SLUG_PLACEHOLDER], locale=locale)
+        return iri_to_uri(template.replace(_SLUG_PLACEHOLDER, slug))
+
+    def _limited_query_and_params(self, max):
+        """Return _query_and_params(), limited to `max` rows if max is given.
+
+        The limit is bound as a parameter like the rest of the query's values
+        rather than formatted into the SQL by hand, and every readout gets it
+        the same way.
+
+        """
+        query, params = self._query_and_params()
+        if max:
+            return query + ' LIMIT %s', tuple(params) + (max,)
+        return query, params
 
 
 class MostVisitedDefaultLanguageReadout(Readout):
@@ -161,7 +285,7 @@ class MostVisitedDefaultLanguageReadout(Readout):
         1: (_lazy(u'Review Needed'), 'wiki.document_revisions'),
         0: (u'', '')}
 
-    def _query_and_params(self, max):
+    def _query_and_params(self):
         # Review Needed: link to /history.
         return ('SELECT engdoc.slug, engdoc.title, '
                 'dashboards_wikidocumentvisits.visits, '
@@ -177,19 +301,17 @@ class MostVisitedDefaultLanguageReadout(Readout):
                'WHERE engdoc.locale=%s '
                'GROUP BY engdoc.id '
                'ORDER BY dashboards_wikidocumentvisits.visits DESC, '
-                        'engdoc.title ASC' + self._limit_clause(max),
+                        'engdoc.title ASC',
             (ALL_TIME if self.mode == ALL_TIME else THIS_WEEK, self.locale))
 
     def _format_row(self, (slug, title, visits, num_unreviewed)):
         needs_review = int(num_unreviewed > 0)
         status, view_name = self.review_statuses[needs_review]
         return (dict(title=title,
-                     url=reverse('wiki.document', args=[slug],
-                                 locale=self.locale),
+                     url=self._slug_url('wiki.document', slug, self.locale),
                      visits=visits,
                      status=status,
-                     status_url=reverse(view_name, args=[slug],
-                                        locale=self.locale)
+                     status_url=self._slug_url(view_name, slug, self.locale)
                                 if view_name else ''))
 
 
@@ -203,7 +325,7 @@ class MostVisitedTranslationsReadout(MostVisitedDefaultLanguageReadout):
         MEDIUM_SIGNIFICANCE: (_lazy(u'Update Needed'), 'wiki.edit_document'),
         MAJOR_SIGNIFICANCE: (_lazy(u'Out of Date'), 'wiki.edit_document')}
 
-    def _query_and_params(self, max):
+    def _query_and_params(self):
         # Out of Date or Update Needed: link to /edit.
         # Review Needed: link to /history.
         # These match the behavior of the corresponding readouts.
@@ -235,7 +357,7 @@ class MostVisitedTranslationsReadout(MostVisitedDefaultLanguageReadout):
                    'AND dashboards_wikidocumentvisits.period=%s '
                'WHERE transdoc.locale=%s '
                'ORDER BY dashboards_wikidocumentvisits.visits DESC, '
-                        'transdoc.title ASC' + self._limit_clause(max),
+                        'transdoc.title ASC',
             (ALL_TIME if self.mode == ALL_TIME else THIS_WEEK, self.locale))
 
     def _format_row(self, (slug, title, visits, significance, needs_review)):
@@ -243,12 +365,10 @@ class MostVisitedTranslationsReadout(MostVisitedDefaultLanguageReadout):
                                 significance,
                                 self.review_statuses[needs_review])
         return (dict(title=title,
-                     url=reverse('wiki.document', args=[slug],
-                                 locale=self.locale),
+                     url=self._slug_url('wiki.document', slug, self.locale),
                      visits=visits,
                      status=status,
-                     status_url=reverse(view_name, args=[slug],
-                                        locale=self.locale)
+                     status_url=self._slug_url(view_name, slug, self.locale)
                                 if view_name else ''))
 
 
@@ -259,39 +379,43 @@ class UntranslatedReadout(Readout):
     slug = 'untranslated'
     column4_label = _lazy(u'Updated')
 
-    def _query_and_params(self, max):
-        # Incidentally, we tried this both as a left join and as a search
+    def _query_and_params(self):
+        # Incidentally, we once tried this both as a left join and as a search
         # against an inner query returning translated docs, and the left join
-        # yielded a faster-looking plan (on a production corpus).
+        # yielded a faster-looking plan (on a production corpus). The NOT
+        # EXISTS form runs on MySQL 5.x as a dependent subquery: one probe of
+        # the unique (parent_id, locale) index per parent, stopping at the
+        # first match. (MySQL 8.0.17+ can turn it into an antijoin.)
         return ('SELECT parent.slug, parent.title, '
             'wiki_revision.reviewed, dashboards_wikidocumentvisits.visits '
             'FROM wiki_document parent '
             'INNER JOIN wiki_revision ON '
                 'parent.current_revision_id=wiki_revision.id '
-            'LEFT JOIN wiki_document translated ON '
-                'parent.id=translated.parent_id AND translated.locale=%s '
             'LEFT JOIN dashboards_wikidocumentvisits ON '
                 'parent.id=dashboards_wikidocumentvisits.document_id AND '
                 'dashboards_wikidocumentvisits.period=%s '
-            'WHERE '
-            'translated.id IS NULL AND parent.is_localizable AND '
-            'parent.locale=%s '
-            + self._order_clause() + self._limit_clause(max),
-            (self.locale, THIS_WEEK, settings.WIKI_DEFAULT_LANGUAGE))
+            'WHERE parent.is_localizable AND parent.locale=%s '
+            'AND NOT EXISTS '
+                '(SELECT 1 FROM wiki_document translated '
+                 'WHERE translated.parent_id=parent.id '
+                 'AND translated.locale=%s) '
+            + self._order_clause(),
+            (THIS_WEEK, settings.WIKI_DEFAULT_LANGUAGE, self.locale))
+
+    def _order_columns(self):
+        # Positions: 1 slug, 2 title, 3 reviewed, 4 visits
+        return ([(3, 'DESC'), (2, 'ASC')] if self.mode == MOST_RECENT
+                else [(4, 'DESC'), (2, 'ASC')])
 
     def _order_clause(self):
-        return ('ORDER BY wiki_revision.reviewed DESC, parent.title ASC'
-                if self.mode == MOST_RECENT
-                else 'ORDER BY dashboards_wikidocumentvisits.visits DESC, '
-                     'parent.title ASC')
+        return 'ORDER BY ' + _positional_order(self._order_columns())
 
     def _format_row(self, (slug, title, reviewed, visits)):
-        # Run the data through the model to (potentially) format it and
-        # take advantage of SPOTs (like for get_absolute_url()):
-        d = Document(slug=slug, title=title,
-                     locale=settings.WIKI_DEFAULT_LANGUAGE)
-        return (dict(title=d.title,
-                     url=d.get_absolute_url(),
+        # Build the URL the same way Document.get_absolute_url() would rather
+        # than instantiating a throwaway Document per row:
+        return (dict(title=title,
+                     url=self._slug_url('wiki.document', slug,
+                                        settings.WIKI_DEFAULT_LANGUAGE),
                      visits=visits,
                      updated=reviewed))
 
@@ -308,70 +432,76 @@ class OutOfDateReadout(Readout):
     # value:
     _max_significance = MAJOR_SIGNIFICANCE
 
-    def _query_and_params(self, max):
+    def _query_and_params(self):
         # At the moment, the "Out of Date Since" column shows the time since
         # the translation was out of date at a MEDIUM level of severity or
         # higher. We could arguably knock this up to MAJOR, but technically it
         # is out of date when the original gets anything more than typo
         # corrections.
-        return ('SELECT transdoc.slug, transdoc.title, engrev.reviewed, '
+        #
+        # The significances and period are module-level ints, not user input,
+        # so they're formatted into the SQL (%d refuses anything else) to give
+        # MySQL's optimizer concrete constants to plan against. Only the
+        # locale is bound as a parameter, hence its escaped placeholder.
+        query = ('SELECT transdoc.slug, transdoc.title, engrev.reviewed, '
             'dashboards_wikidocumentvisits.visits '
-            'FROM wiki_document transdoc '
-            'INNER JOIN wiki_revision engrev ON engrev.id='
-            # The oldest english rev to have an approved level-30 change since
-            # the translated doc had an approved rev based on it. NULL if there
-            # is none:
-                '(SELECT min(id) FROM wiki_revision '
-                # Narrow engrev rows to those representing revision of parent
-                # doc:
-                'WHERE wiki_revision.document_id=transdoc.parent_id '
-                # For the purposes of computing the "Out of Date Since" column,
-                # the revision that threw the translation out of date had
-                # better be more recent than the one the current translation is
-                # based on:
-                'AND wiki_revision.id>'
-                    '(SELECT based_on_id FROM wiki_revision basedonrev '
-                    'WHERE basedonrev.id=transdoc.current_revision_id) '
-                'AND wiki_revision.significance>=%s '
-                'AND %s='
-                # Completely filter out outer selections where 30 is not the
-                # max signif of english revisions since trans was last
-                # approved. Other maxes will be shown by other readouts.
-                # Optimize: try "30 IN" if MySQL's statistics gatherer is
-                # stupid/nonexistent; the inner query should be able to bail
-                # out early. [Ed: No effect on EXPLAIN on admittedly light test
-                # corpus.]
-                  '(SELECT MAX(engsince.significance) '
-                  'FROM wiki_revision engsince '
-                  'WHERE engsince.document_id=transdoc.parent_id '
-                  # Assumes that any approved revision became the current
-                  # revision at some point: we don't let the user go back and
-                  # approve revisions older than the latest approved one.
-                  'AND engsince.is_approved '
-                  'AND engsince.id>'
-                  # The English revision the current translation's based on:
-                    '(SELECT based_on_id FROM wiki_revision basedonrev '
-                    'WHERE basedonrev.id=transdoc.current_revision_id) '
-                  ')'
-                ') '
+            # Gather, in one pass over the parent docs' revisions, what we need
+            # to know about the English changes made since each translation's
+            # current revision was based on its parent. This is a plain
+            # derived table rather than a LATERAL join: MySQL 5.x doesn't
+            # support LATERAL, and grouping by translation already evaluates
+            # the MIN() once per translation rather than once per outer row.
+            'FROM (SELECT trans.id AS transdoc_id, '
+                # The oldest english rev to have a level-30-or-higher change
+                # since the translated doc had an approved rev based on it:
+                'MIN(CASE WHEN engsince.significance>=%(medium)d '
+                    'THEN engsince.id END) AS first_bad_id, '
+                # Assumes that any approved revision became the current
+                # revision at some point: we don't let the user go back and
+                # approve revisions older than the latest approved one.
+                'MAX(CASE WHEN engsince.is_approved '
+                    'THEN engsince.significance END) AS max_significance '
+                'FROM wiki_document trans '
+                # The English revision the current translation's based on:
+                'INNER JOIN wiki_revision basedonrev ON '
+                    'basedonrev.id=trans.current_revision_id '
+                # For the purposes of computing the "Out of Date Since"
+                # column, the revision that threw the translation out of date
+                # had better be more recent than the one the current
+                # translation is based on:
+                'INNER JOIN wiki_revision engsince ON '
+                    'engsince.document_id=trans.parent_id '
+                    'AND engsince.id>basedonrev.based_on_id '
+                'WHERE trans.locale=%%s '
+                'GROUP BY trans.id) since '
+            'INNER JOIN wiki_document transdoc ON '
+                'transdoc.id=since.transdoc_id '
+            'INNER JOIN wiki_revision engrev ON '
+                'engrev.id=since.first_bad_id '
             # Join up the visits table for stats:
             'LEFT JOIN dashboards_wikidocumentvisits ON '
                 'engrev.document_id=dashboards_wikidocumentvisits.document_id '
-                'AND dashboards_wikidocumentvisits.period=%s '
-            'WHERE transdoc.locale=%s '
-            + self._order_clause() + self._limit_clause(max),
-            (MEDIUM_SIGNIFICANCE, self._max_significance, THIS_WEEK,
-                self.locale))
+                'AND dashboards_wikidocumentvisits.period=%(period)d '
+            # Completely filter out outer selections where 30 is not the max
+            # signif of english revisions since trans was last approved. Other
+            # maxes will be shown by other readouts.
+            'WHERE since.max_significance=%(max_significance)d '
+            % {'medium': MEDIUM_SIGNIFICANCE, 'period': THIS_WEEK,
+               'max_significance': self._max_significance})
+        return (query + self._order_clause(),
+                (self.locale,))
+
+    def _order_columns(self):
+        # Positions: 1 slug, 2 title, 3 reviewed, 4 visits
+        return ([(3, 'DESC'), (2, 'ASC')] if self.mode == MOST_RECENT
+                else [(4, 'DESC'), (2, 'ASC')])
 
     def _order_clause(self):
-        return ('ORDER BY engrev.reviewed DESC'
-                if self.mode == MOST_RECENT
-                else 'ORDER BY dashboards_wikidocumentvisits.visits DESC, '
-                     'transdoc.title ASC')
+        return 'ORDER BY ' + _positional_order(self._order_columns())
 
     def _format_row(self, (slug, title, reviewed, visits)):
         return (dict(title=title,
-                     url=reverse('wiki.edit_document', args=[slug]),
+                     url=self._slug_url('wiki.edit_document', slug),
                      visits=visits, updated=reviewed))
 
 
@@ -394,18 +524,19 @@ class UnreviewedReadout(Readout):
     slug = 'unreviewed'
     column4_label = _lazy(u'Changed')
 
-    def _query_and_params(self, max):
+    def _query_and_params(self):
         english_id = ('id' if self.locale == settings.WIKI_DEFAULT_LANGUAGE
                       else 'parent_id')
-        return ('SELECT wiki_document.slug, wiki_document.title, '
+        # The names of the users who made the changes are fetched separately
+        # by _format_rows(); a GROUP_CONCAT here gets truncated at
+        # group_concat_max_len and makes MySQL sort on disk for big locales.
+        return ('SELECT wiki_document.id, wiki_document.slug, '
+            'wiki_document.title, '
             'MAX(wiki_revision.created) maxcreated, '
-            'GROUP_CONCAT(DISTINCT auth_user.username '
-                         "ORDER BY wiki_revision.id SEPARATOR ', '), "
             'dashboards_wikidocumentvisits.visits '
             'FROM wiki_document '
             'INNER JOIN wiki_revision ON '
                         'wiki_document.id=wiki_revision.document_id '
-            'INNER JOIN auth_user ON wiki_revision.creator_id=auth_user.id '
             'LEFT JOIN dashboards_wikidocumentvisits ON '
                 'wiki_document.' + english_id
                     + '=dashboards_wikidocumentvisits.document_id AND '
@@ -415,7 +546,7 @@ class UnreviewedReadout(Readout):
                  'wiki_revision.id>wiki_document.current_revision_id) '
             'AND wiki_document.locale=%s '
             'GROUP BY wiki_document.id '
-            + self._order_clause() + self._limit_clause(max),
+            + self._order_clause(),
             (THIS_WEEK, self.locale))
 
     def _order_clause(self):
@@ -424,23 +555,113 @@ class UnreviewedReadout(Readout):
                 else 'ORDER BY dashboards_wikidocumentvisits.visits DESC, '
                      'wiki_document.title ASC')
 
-    def _format_row(self, (slug, title, changed, users, visits)):
+    def _format_rows(self, rows):
+        users = self._unreviewed_users([r[0] for r in rows])
+        return [self._format_row(r + (users.get(r[0], u''),)) for r in rows]
+
+    @staticmethod
+    def _unreviewed_users(document_ids):
+        """Return a dict mapping each of the given document IDs to a
+        comma-separated string of the users who made its unreviewed changes,
+        oldest change first.
+
+        """
+        if not document_ids:
+            return {}
+        cursor = db_cursor()
+        try:
+            cursor.execute(
+                'SELECT wiki_revision.document_id, auth_user.username '
+                'FROM wiki_revision '
+                'INNER JOIN wiki_document ON '
+                    'wiki_document.id=wiki_revision.document_id '
+                'INNER JOIN auth_user ON '
+                    'wiki_revision.creator_id=auth_user.id '
+                'WHERE wiki_revision.reviewed IS NULL '
+                'AND (wiki_document.current_revision_id IS NULL OR '
+                     'wiki_revision.id>wiki_document.current_revision_id) '
+                'AND wiki_revision.document_id IN (%s) '
+                'ORDER BY wiki_revision.document_id, wiki_revision.id'
+                    % ', '.join(['%s'] * len(document_ids)),
+                document_ids)
+            db_rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        names = {}
+        for document_id, username in db_rows:
+            doc_names = names.setdefault(document_id, [])
+            if username not in doc_names:
+                doc_names.append(username)
+        return dict((document_id, u', '.join(doc_names))
+                    for document_id, doc_names in names.iteritems())
+
+    def _format_row(self,
+                    (document_id, slug, title, changed, visits, users)):
         return (dict(title=title,
-                     url=reverse('wiki.document_revisions', args=[slug],
-                                 locale=self.locale),
+                     url=self._slug_url('wiki.document_revisions', slug,
+                                        self.locale),
                      visits=visits,
                      updated=changed,
                      users=users))
 
 
+def prefetch_rows(readouts, max, cursor=None):
+    """Fetch the first `max` rows of each of the given readouts in one query.
+
+    The readouts' queries are glued together with UNION ALL, so they must
+    return the same number and types of columns and have the same
+    _order_columns(). Afterward, each readout's rows() returns its share for
+    any `max` up to this one without going back to the DB.
+
+    """
+    orders = set([tuple(r._order_columns()) for r in readouts])
+    if len(orders) != 1:
+        raise ValueError('Readouts fetched together must sort the same way.')
+
+    queries, params = [], []
+    for i, readout in enumerate(readouts):
+        query, query_params = readout._limited_query_and_params(max)
+        if not query.startswith('SELECT '):
+            raise ValueError('Can\'t tag rows of query: %s' % query)
+        # Tag each row with the index of the readout it belongs to:
+        queries.append('(SELECT %d, %s)' % (i, query[len('SELECT '):]))
+        params.extend(query_params)
+
+    rows = [[] for r in readouts]
+    own_cursor = cursor is None
+    if own_cursor:
+        cursor = db_cursor()
+    try:
+        # Each part's ORDER BY ... LIMIT picks its rows, but MySQL doesn't
+        # promise to return them in that order, so sort the whole union by
+        # readout and then by the readouts' shared order (shifted past the
+        # tag column):
+        cursor.execute(' UNION ALL '.join(queries) + ' ORDER BY 1, ' +
+                       _positional_order(orders.pop(), offset=1),
+                       params)
+        for row in cursor.fetchall():
+            rows[row[0]].append(row[1:])
+    finally:
+        if own_cursor:
+            cursor.close()
+
+    for readout, readout_rows in zip(readouts, rows):
+        readout._prefetched = (max, readout._format_rows(readout_rows))
+
+
 # L10n Dashboard tables that have their own whole-page views:
-L10N_READOUTS = SortedDict((t.slug, t) for t in
-    [MostVisitedTranslationsReadout, UntranslatedReadout, OutOfDateReadout,
-     NeedingUpdatesReadout, UnreviewedReadout])
+L10N_READOUTS = OrderedDict([(t.slug, t) for t in
+    (MostVisitedTranslationsReadout, UntranslatedReadout, OutOfDateReadout,
+     NeedingUpdatesReadout, UnreviewedReadout)])
 
 # Contributors ones:
-CONTRIBUTOR_READOUTS = SortedDict((t.slug, t) for t in
-    [MostVisitedDefaultLanguageReadout, UnreviewedReadout])
+CONTRIBUTOR_READOUTS = OrderedDict([(t.slug, t) for t in
+    (MostVisitedDefaultLanguageReadout, UnreviewedReadout)])
+
+# L10n Dashboard tables whose rows have the same shape (slug, title, a
+# datetime, visits), so prefetch_rows() can fetch them together:
+UNION_READOUT_SLUGS = (UntranslatedReadout.slug, OutOfDateReadout.slug,
+                       NeedingUpdatesReadout.slug)
 
 # All:
 READOUTS = L10N_READOUTS.copy()
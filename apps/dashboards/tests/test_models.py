@@ -1,12 +1,15 @@
 # -*- coding: utf-8 -*-
 from django.conf import settings
+from django.core.cache import cache
 
 from mock import patch_object
 from nose.tools import raises, eq_
 
 from dashboards.models import (WikiDocumentVisits, StatsException, THIS_WEEK,
-                               StatsIOError)
+                               StatsIOError, OVERVIEW_TOTAL_CACHE_KEY,
+                               OVERVIEW_TRANSLATED_CACHE_KEY_TMPL)
 from devmo.tests import SkippedTestCase
+from sumo.tests import TestCase
 from wiki.tests import document, revision
 
 
@@ -107,3 +110,26 @@ class DocumentVisitsTests(SkippedTestCase):
             '"measures":{"Visits":213817.0,"Views":595329.0,"Average Time '
             'Viewed":25.0},"SubRows":null}}}}}'
             % ((settings.LANGUAGE_CODE,) * 2)))
+
+
+class OverviewCountsCacheTests(TestCase):
+    """Tests for invalidation of the cached Overview table counts"""
+
+    def setUp(self):
+        super(OverviewCountsCacheTests, self).setUp()
+        cache.set(OVERVIEW_TOTAL_CACHE_KEY, 5)
+        cache.set(OVERVIEW_TRANSLATED_CACHE_KEY_TMPL % 'de', 3)
+        cache.set(OVERVIEW_TRANSLATED_CACHE_KEY_TMPL % 'fr', 2)
+
+    def test_default_locale_save(self):
+        """Saving a default-language doc drops the shared total."""
+        document(locale=settings.WIKI_DEFAULT_LANGUAGE, save=True)
+        eq_(None, cache.get(OVERVIEW_TOTAL_CACHE_KEY))
+        eq_(3, cache.get(OVERVIEW_TRANSLATED_CACHE_KEY_TMPL % 'de'))
+
+    def test_translation_save(self):
+        """Saving a translation drops only its own locale's count."""
+        document(locale='de', save=True)
+        eq_(5, cache.get(OVERVIEW_TOTAL_CACHE_KEY))
+        eq_(None, cache.get(OVERVIEW_TRANSLATED_CACHE_KEY_TMPL % 'de'))
+        eq_(2, cache.get(OVERVIEW_TRANSLATED_CACHE_KEY_TMPL % 'fr'))
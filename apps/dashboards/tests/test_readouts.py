@@ -1,8 +1,20 @@
 from datetime import datetime
 from functools import partial
 
-from dashboards.readouts import UnreviewedReadout
+from django.core.cache import cache
+
+from nose.tools import eq_
+
+from dashboards.models import (OVERVIEW_TOTAL_CACHE_KEY,
+                               OVERVIEW_TRANSLATED_CACHE_KEY_TMPL)
+from dashboards.readouts import (overview_rows, UnreviewedReadout,
+                                 UntranslatedReadout, OutOfDateReadout,
+                                 NeedingUpdatesReadout, prefetch_rows,
+                                 MOST_RECENT)
 from devmo.tests import SkippedTestCase
+from sumo.tests import TestCase, get_user
+from sumo.urlresolvers import reverse
+from wiki.models import MEDIUM_SIGNIFICANCE, MAJOR_SIGNIFICANCE
 from wiki.tests import revision, translated_revision
 
 
@@ -53,3 +65,192 @@ class UnreviewedChangesTests(SkippedTestCase):
         rejected = translated_revision(reviewed=datetime.now())
         rejected.save()
         assert rejected.document.title not in self.titles()
+
+
+class UnreviewedUsersTests(TestCase):
+    """Tests for the users listed by the Unreviewed Changes readout"""
+
+    fixtures = ['test_users.json']
+
+    def test_users_listed_once_in_order(self):
+        """List each user who made an unreviewed change once, oldest change
+        first."""
+        first = translated_revision(creator=get_user('testuser2'),
+                                    created=datetime(2000, 1, 1), save=True)
+        for day in (2, 3):
+            revision(document=first.document, creator=get_user('testuser'),
+                     created=datetime(2000, 1, day), save=True)
+        row = [r for r in UnreviewedReadout(MockRequest()).rows()
+               if r['title'] == first.document.title][0]
+        eq_('testuser2, testuser', row['users'])
+
+
+class SlugUrlTests(TestCase):
+    """Tests for the per-readout URL template cache"""
+
+    def test_matches_reverse(self):
+        """Substituted URLs match what reverse() would build, even for slugs
+        that need quoting."""
+        readout = UnreviewedReadout(MockRequest())
+        for slug in ['Simple', u'hell\u1ed7', 'Nested/Page']:
+            eq_(reverse('wiki.document', args=[slug], locale='de'),
+                readout._slug_url('wiki.document', slug, 'de'))
+
+
+class PrefetchRowsTests(TestCase):
+    """Tests for fetching several readouts' rows in one query"""
+
+    fixtures = ['test_users.json']
+
+    @staticmethod
+    def readouts():
+        return [UntranslatedReadout(MockRequest()),
+                OutOfDateReadout(MockRequest()),
+                NeedingUpdatesReadout(MockRequest())]
+
+    # No visits are recorded, so the title tie-break decides the order, and
+    # MySQL's collation sorts u'\xdc' among the Us, not after the Zs:
+    titles = [u'Zeichen', u'\xdcbersicht', u'Apfel']
+
+    def setUp(self):
+        super(PrefetchRowsTests, self).setUp()
+        for i, title in enumerate(self.titles):
+            # An untranslated article:
+            revision(title=title, slug='untranslated-%s' % i,
+                     is_approved=True, save=True)
+            # An out-of-date translation and one needing updates:
+            for significance in (MAJOR_SIGNIFICANCE, MEDIUM_SIGNIFICANCE):
+                slug = '%s-%s' % (significance, i)
+                trans = translated_revision(title=title, slug=slug,
+                                            is_approved=True, save=True)
+                revision(document=trans.document.parent, title=title,
+                         slug=slug, significance=significance,
+                         is_approved=True, save=True)
+
+    def test_same_as_separate_queries(self):
+        """Each readout gets the rows, in the order, it would have fetched on
+        its own."""
+        expected = [r.rows(10) for r in self.readouts()]
+        for rows in expected:
+            eq_([u'Apfel', u'\xdcbersicht', u'Zeichen'],
+                [row['title'] for row in rows])
+
+        readouts = self.readouts()
+        prefetch_rows(readouts, 10)
+        with self.assertNumQueries(0):
+            eq_(expected, [r.rows(10) for r in readouts])
+
+    def test_fewer_rows(self):
+        """Serve requests for fewer rows than were prefetched, too."""
+        expected = [r.rows(2) for r in self.readouts()]
+
+        readouts = self.readouts()
+        prefetch_rows(readouts, 10)
+        with self.assertNumQueries(0):
+            eq_(expected, [r.rows(2) for r in readouts])
+
+    def test_mixed_orders(self):
+        """Refuse to fetch readouts that sort differently together."""
+        readouts = [UntranslatedReadout(MockRequest()),
+                    OutOfDateReadout(MockRequest(), mode=MOST_RECENT)]
+        self.assertRaises(ValueError, prefetch_rows, readouts, 10)
+
+
+class OutOfDateTests(TestCase):
+    """Tests for the Out-of-Date and Needing Updates readouts"""
+
+    fixtures = ['test_users.json']
+
+    @staticmethod
+    def rows(readout_class):
+        """Return the rows shown by the given readout, keyed by title."""
+        return dict((row['title'], row) for row in
+                    readout_class(MockRequest()).rows())
+
+    @staticmethod
+    def translation(**kwargs):
+        """Return a saved, approved translation revision."""
+        return translated_revision(is_approved=True, save=True, **kwargs)
+
+    @staticmethod
+    def english_change(translation, significance, is_approved=True):
+        """Save and return a new revision of the translation's parent."""
+        return revision(document=translation.document.parent,
+                        significance=significance, is_approved=is_approved,
+                        save=True)
+
+    def test_major_change(self):
+        """Show a translation whose parent had a major change since the
+        revision it's based on, out of date since that change."""
+        trans = self.translation()
+        major = self.english_change(trans, MAJOR_SIGNIFICANCE)
+        rows = self.rows(OutOfDateReadout)
+        assert trans.document.title in rows
+        eq_(major.reviewed, rows[trans.document.title]['updated'])
+        assert trans.document.title not in self.rows(NeedingUpdatesReadout)
+
+    def test_medium_change(self):
+        """Show a translation whose parent had only medium changes as needing
+        updates, not as out of date."""
+        trans = self.translation()
+        medium = self.english_change(trans, MEDIUM_SIGNIFICANCE)
+        rows = self.rows(NeedingUpdatesReadout)
+        assert trans.document.title in rows
+        eq_(medium.reviewed, rows[trans.document.title]['updated'])
+        assert trans.document.title not in self.rows(OutOfDateReadout)
+
+    def test_unapproved_major_change(self):
+        """An unapproved major change dates how long the translation has been
+        out of date but doesn't count toward how out of date it is."""
+        trans = self.translation()
+        self.english_change(trans, MAJOR_SIGNIFICANCE, is_approved=False)
+        self.english_change(trans, MEDIUM_SIGNIFICANCE)
+        rows = self.rows(NeedingUpdatesReadout)
+        assert trans.document.title in rows
+        # The unapproved revision was never reviewed:
+        eq_(None, rows[trans.document.title]['updated'])
+        assert trans.document.title not in self.rows(OutOfDateReadout)
+
+    def test_no_based_on(self):
+        """Leave out translations whose current revision isn't based on any
+        parent revision."""
+        trans = self.translation(based_on=None)
+        self.english_change(trans, MAJOR_SIGNIFICANCE)
+        assert trans.document.title not in self.rows(OutOfDateReadout)
+        assert trans.document.title not in self.rows(NeedingUpdatesReadout)
+
+
+class OverviewRowsTests(TestCase):
+    """Tests for the Overview table's cached document counts"""
+
+    fixtures = ['test_users.json']
+
+    def setUp(self):
+        super(OverviewRowsTests, self).setUp()
+        self.translated_key = (OVERVIEW_TRANSLATED_CACHE_KEY_TMPL %
+                               NON_DEFAULT_LOCALE)
+
+    @staticmethod
+    def all_articles_row():
+        return overview_rows(NON_DEFAULT_LOCALE)[1]
+
+    def test_miss_fills_cache(self):
+        """On a miss, count from the DB and cache both counts."""
+        translated_revision(is_approved=True, save=True)
+        revision(is_approved=True, save=True)
+        cache.delete(OVERVIEW_TOTAL_CACHE_KEY)
+        cache.delete(self.translated_key)
+
+        row = self.all_articles_row()
+        eq_((1, 2), (row['numerator'], row['denominator']))
+        eq_(2, cache.get(OVERVIEW_TOTAL_CACHE_KEY))
+        eq_(1, cache.get(self.translated_key))
+
+    def test_hit_reads_cache(self):
+        """On a hit, use the cached counts without counting again."""
+        cache.set(OVERVIEW_TOTAL_CACHE_KEY, 7)
+        cache.set(self.translated_key, 3)
+
+        row = self.all_articles_row()
+        eq_((3, 7), (row['numerator'], row['denominator']))
+        eq_(43, row['percent'])
@@ -9,8 +9,27 @@ from waffle.models import Flag
 from dashboards.readouts import CONTRIBUTOR_READOUTS
 from sumo.tests import TestCase
 from sumo.urlresolvers import reverse
+from wiki.models import MAJOR_SIGNIFICANCE
+from wiki.tests import revision, translated_revision
 
 class LocalizationDashTests(TestCase):
+    fixtures = ['test_users.json']
+
+    def test_main_view(self):
+        """Assert the localization dash renders its readouts' rows."""
+        untranslated = revision(is_approved=True, save=True)
+        trans = translated_revision(is_approved=True, save=True)
+        revision(document=trans.document.parent,
+                 significance=MAJOR_SIGNIFICANCE, is_approved=True, save=True)
+
+        response = self.client.get(reverse('dashboards.localization',
+                                           locale='de'))
+        eq_(200, response.status_code)
+        doc = pq(response.content)
+        ok_(untranslated.document.title in
+            doc('#untranslated-table').text())
+        ok_(trans.document.title in doc('#out-of-date-table').text())
+
     def test_redirect_to_contributor_dash(self):
         """Should redirect to Contributor Dash if the locale is the default"""
         response = self.client.get(reverse('dashboards.localization',
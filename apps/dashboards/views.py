@@ -15,8 +15,9 @@ import jinja2
 from tower import ugettext_lazy as _lazy, ugettext as _
 from waffle.decorators import waffle_flag
 
-from dashboards.readouts import (overview_rows, READOUTS, L10N_READOUTS,
-                                 CONTRIBUTOR_READOUTS)
+from dashboards.readouts import (overview_rows, prefetch_rows, READOUTS,
+                                 L10N_READOUTS, CONTRIBUTOR_READOUTS,
+                                 UNION_READOUT_SLUGS, db_cursor)
 from sumo_locales import LOCALES
 from sumo.parser import get_object_fallback
 from sumo.urlresolvers import reverse
@@ -34,6 +35,8 @@ HOME_DOCS = {'quick': 'Home page - Quick', 'explore': 'Home page - Explore'}
 MOBILE_DOCS = {'quick': 'Mobile home - Quick',
                'explore': 'Mobile home - Explore'}
 PAGE_SIZE = 100
+# How many rows each readout shows on a dashboard page:
+READOUT_PREVIEW_ROWS = 10
 
 
 def home(request):
@@ -102,8 +105,7 @@ def _kb_main(request, readouts, template, locale=None, extra_data=None):
     `extra_data` dict to the template in addition to the standard data.
 
     """
-    data = {'readouts': SortedDict((slug, class_(request, locale=locale))
-                         for slug, class_ in readouts.iteritems()),
+    data = {'preview_rows': READOUT_PREVIEW_ROWS,
             'default_locale': settings.WIKI_DEFAULT_LANGUAGE,
             'default_locale_name':
                 LOCALES[settings.WIKI_DEFAULT_LANGUAGE].native,
@@ -117,7 +119,22 @@ def _kb_main(request, readouts, template, locale=None, extra_data=None):
                     request.user, locale=settings.WIKI_DEFAULT_LANGUAGE)}
     if extra_data:
         data.update(extra_data)
-    return render(request, 'dashboards/' + template, data)
+
+    # All the readouts on the page run their queries on one cursor:
+    cursor = db_cursor()
+    try:
+        data['readouts'] = SortedDict(
+            (slug, class_(request, locale=locale, cursor=cursor))
+            for slug, class_ in readouts.iteritems())
+        # Fetch the preview rows of the readouts that can share a query in a
+        # single round-trip:
+        union_readouts = [r for slug, r in data['readouts'].iteritems()
+                          if slug in UNION_READOUT_SLUGS]
+        if len(union_readouts) > 1:
+            prefetch_rows(union_readouts, READOUT_PREVIEW_ROWS, cursor)
+        return render(request, 'dashboards/' + template, data)
+    finally:
+        cursor.close()
 
 
 @require_GET
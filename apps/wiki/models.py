@@ -560,6 +560,9 @@ class Document(NotificationsMixin, ModelBase):
 
     class Meta(object):
         unique_together = (('parent', 'locale'), ('slug', 'locale'))
+        # There's also a composite index on (locale, current_revision,
+        # is_localizable, parent), added in migration 0028, which lets the L10n
+        # dashboard's Overview counts be answered from the index alone.
         permissions = (
             ("add_template_document", "Can add Template:* document"),
             ("change_template_document", "Can change Template:* document"),